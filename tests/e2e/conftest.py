@@ -0,0 +1,74 @@
+"""
+Shared fixtures for the browser-driven end-to-end tests.
+
+A single headless WebDriver is started per test session (per worker under
+pytest-xdist) and handed to each browser test class, which resets game state
+through JavaScript instead of relaunching the browser.
+
+File: tests/e2e/conftest.py
+"""
+
+import os
+from typing import Iterator
+from urllib.parse import urlsplit, urlunsplit
+
+import pytest
+from selenium import webdriver
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+DEFAULT_GAME_URL = "http://localhost:8080"
+
+
+def game_url() -> str:
+    """
+    Resolve the game server URL for the current test worker.
+
+    The base URL comes from ``GAME_URL`` (default http://localhost:8080) and
+    is shared by all workers. When one game server per pytest-xdist worker
+    is provisioned, set ``GAME_SERVER_PER_WORKER=1`` and worker gwN uses the
+    base port + N.
+    """
+    base = os.environ.get("GAME_URL", DEFAULT_GAME_URL)
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    if not worker or os.environ.get("GAME_SERVER_PER_WORKER") != "1":
+        return base
+
+    parts = urlsplit(base)
+    port = (parts.port or 80) + int(worker[2:])
+    return urlunsplit(parts._replace(netloc=f"{parts.hostname}:{port}"))
+
+
+@pytest.fixture(scope="session")
+def shared_driver() -> Iterator[webdriver.Chrome]:
+    """Launch one headless browser for the whole session and load the game."""
+    # Headless Chrome: the tests only read DOM/gameState, so skip
+    # rendering and image decoding entirely
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--no-sandbox")
+    options.add_experimental_option(
+        "prefs", {"profile.managed_default_content_settings.images": 2}
+    )
+    driver = webdriver.Chrome(options=options)
+
+    yield driver
+
+    driver.quit()
+
+
+@pytest.fixture(scope="class")
+def browser(request: pytest.FixtureRequest, shared_driver: webdriver.Chrome) -> None:
+    """
+    Attach the shared driver and a default wait to a unittest-style class.
+
+    The game page is only loaded when the browser is not already on it, so
+    classes after the first reuse the loaded page and reset state in JS.
+    """
+    url = game_url()
+    if not shared_driver.current_url.startswith(url):
+        shared_driver.get(url)
+
+    request.cls.driver = shared_driver
+    request.cls.wait = WebDriverWait(shared_driver, 10)
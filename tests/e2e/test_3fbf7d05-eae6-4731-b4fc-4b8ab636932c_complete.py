@@ -6,68 +6,137 @@ File: tests/e2e/test_3fbf7d05-eae6-4731-b4fc-4b8ab636932c_complete.py
 """
 
 # TODO: Fix import - import unittest
-# TODO: Fix import - from selenium import webdriver
 from app.models.common import By
-# TODO: Fix import - from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.ui import WebDriverWait
 # TODO: Fix import - from selenium.webdriver.support import expected_conditions as EC
-import time
-import json
-from typing import Dict, List, Any
+from selenium.common.exceptions import TimeoutException
+import pytest
+from typing import Any, Callable, Dict, List, Optional
 import logging
 from pathlib import Path
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
+@pytest.mark.xdist_group(name="browser_enemy_system")
+@pytest.mark.usefixtures("browser")
 class EnemySystemE2ETests(unittest.TestCase):
-    """End-to-end test suite for Enemy System Implementation validation."""
+    """
+    End-to-end test suite for Enemy System Implementation validation.
 
-    @classmethod
-    def setUpClass(cls) -> None:
-        """Initialize WebDriver and load game page."""
-        cls.driver = webdriver.Firefox()  # Can be changed to Chrome if preferred
-        cls.driver.get("http://localhost:8080")  # Adjust port as needed
-        cls.wait = WebDriverWait(cls.driver, 10)
-        
-    @classmethod
-    def tearDownClass(cls) -> None:
-        """Clean up resources."""
-        if cls.driver:
-            cls.driver.quit()
+    The WebDriver is the session-wide ``shared_driver`` from conftest.py.
+    """
+
+    _cached_state: Optional[Dict[str, Any]] = None
 
     def setUp(self) -> None:
         """Reset game state before each test."""
+        self._cached_state = None
         self.reset_game_state()
 
     def reset_game_state(self) -> None:
         """Reset the game to initial state."""
         try:
-            reset_button = self.wait.until(
-                EC.presence_of_element_located((By.ID, "reset-game"))
-            )
-            reset_button.click()
-            time.sleep(1)  # Allow game to reset
+            self.driver.execute_script("""
+                if (window.resetGame) {
+                    window.resetGame();
+                } else {
+                    document.getElementById('reset-game').click();
+                }
+            """)
+            if not self._wait_until_js(
+                "window.gameState && window.gameState.currentWave === 1"
+            ):
+                raise TimeoutException("Game did not return to wave 1 after reset")
         except Exception as e:
-            logger.error(f"Failed to reset game state: {str(e)}")
+            logger.error("Failed to reset game state: %s", e)
             raise
 
     def get_game_state(self) -> Dict[str, Any]:
         """Retrieve current game state from JavaScript context."""
         return self.driver.execute_script("return window.gameState;")
 
+    def _state(self, refresh: bool = False) -> Dict[str, Any]:
+        """
+        Return the cached game state, fetching it only when stale.
+
+        The cache is dropped whenever a helper changes the game (start, shot,
+        wave clear) and is refilled by ``_snapshot``.
+
+        Args:
+            refresh: Force a new read from the browser
+        """
+        if refresh or self._cached_state is None:
+            self._cached_state = self.get_game_state()
+        return self._cached_state
+
+    def start_game(self) -> None:
+        """Start the game and drop any cached game state."""
+        self.driver.execute_script("window.startGame();")
+        self._cached_state = None
+
+    def _wait_until(self, predicate: Callable[[Any], Any], timeout: float = 5) -> bool:
+        """
+        Poll a predicate against the driver instead of sleeping a fixed time.
+
+        Args:
+            predicate: Callable receiving the driver, truthy once ready
+            timeout: Maximum time to wait in seconds
+
+        Returns:
+            True if the predicate became truthy, False on timeout
+        """
+        try:
+            WebDriverWait(self.driver, timeout).until(predicate)
+            return True
+        except TimeoutException:
+            return False
+
+    def _wait_until_js(self, condition: str, timeout: float = 5) -> bool:
+        """Poll a JavaScript expression until it evaluates truthy."""
+        return self._wait_until(
+            lambda driver: driver.execute_script(f"return ({condition});"),
+            timeout
+        )
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """
+        Read enemy DOM data and game state in a single WebDriver round-trip.
+
+        Returns:
+            Dict with enemy count, positions and the full game state, which
+            also refreshes the ``_state`` cache.
+        """
+        snapshot = self.driver.execute_script("""
+            if (!window.gameState) {
+                return null;
+            }
+            const enemies = document.getElementsByClassName('enemy');
+            return {
+                count: enemies.length,
+                positions: Array.from(enemies, enemy => ({
+                    x: parseFloat(enemy.style.left),
+                    y: parseFloat(enemy.style.top)
+                })),
+                state: window.gameState
+            };
+        """)
+        if snapshot is None:
+            self.fail("window.gameState is not exposed on the page")
+        self._cached_state = snapshot["state"]
+        return snapshot
+
     def test_enemy_spawn_basic(self) -> None:
         """Validate basic enemy spawning functionality."""
         self.wait.until(EC.presence_of_element_located((By.ID, "game-canvas")))
         
         # Start game
-        self.driver.execute_script("window.startGame();")
-        time.sleep(2)  # Allow initial enemies to spawn
+        self.start_game()
+        self._wait_until_js("document.getElementsByClassName('enemy').length > 0")
         
         # Get enemy count
-        enemy_count = self.driver.execute_script(
-            "return document.querySelectorAll('.enemy').length;"
-        )
+        enemy_count = self._snapshot()["count"]
         
         self.assertGreater(enemy_count, 0, "No enemies spawned")
 
@@ -76,11 +145,14 @@ class EnemySystemE2ETests(unittest.TestCase):
         self.wait.until(EC.presence_of_element_located((By.ID, "game-canvas")))
         
         # Start game and capture initial positions
-        self.driver.execute_script("window.startGame();")
-        time.sleep(1)
+        self.start_game()
+        self.assertTrue(
+            self._wait_until_js("document.getElementsByClassName('enemy').length > 0"),
+            "No enemies spawned"
+        )
         
         initial_positions = self.get_enemy_positions()
-        time.sleep(2)
+        self._wait_until(lambda driver: self.get_enemy_positions() != initial_positions)
         final_positions = self.get_enemy_positions()
         
         # Verify movement occurred
@@ -95,15 +167,13 @@ class EnemySystemE2ETests(unittest.TestCase):
         self.wait.until(EC.presence_of_element_located((By.ID, "game-canvas")))
         
         # Start game
-        self.driver.execute_script("window.startGame();")
+        self.start_game()
         
         # Complete first wave
         self.clear_current_wave()
         
         # Get wave number
-        wave_number = self.driver.execute_script(
-            "return window.gameState.currentWave;"
-        )
+        wave_number = self._state()["currentWave"]
         
         self.assertEqual(wave_number, 2, "Wave did not progress after clearing enemies")
 
@@ -112,16 +182,14 @@ class EnemySystemE2ETests(unittest.TestCase):
         self.wait.until(EC.presence_of_element_located((By.ID, "game-canvas")))
         
         # Start game
-        self.driver.execute_script("window.startGame();")
+        self.start_game()
         
         # Simulate player shot
         self.simulate_player_shot()
-        time.sleep(1)
+        self._wait_until_js("window.gameState.enemiesDestroyed > 0")
         
         # Check if any enemy was destroyed
-        enemies_destroyed = self.driver.execute_script(
-            "return window.gameState.enemiesDestroyed;"
-        )
+        enemies_destroyed = self._state()["enemiesDestroyed"]
         
         self.assertGreater(
             enemies_destroyed,
@@ -131,21 +199,31 @@ class EnemySystemE2ETests(unittest.TestCase):
 
     def get_enemy_positions(self) -> List[Dict[str, float]]:
         """Get current positions of all enemies."""
-        return self.driver.execute_script("""
-            return Array.from(document.querySelectorAll('.enemy')).map(enemy => ({
-                x: parseFloat(enemy.style.left),
-                y: parseFloat(enemy.style.top)
-            }));
-        """)
+        return self._snapshot()["positions"]
 
     def clear_current_wave(self) -> None:
         """Helper method to clear current wave of enemies."""
-        self.driver.execute_script("""
-            const enemies = document.querySelectorAll('.enemy');
-            enemies.forEach(enemy => enemy.remove());
+        previous_wave = self.driver.execute_script("""
+            if (!window.gameState) {
+                return null;
+            }
+            const previousWave = window.gameState.currentWave;
+            // Live HTMLCollection: remove from the end so indices stay valid
+            const enemies = document.getElementsByClassName('enemy');
+            for (let i = enemies.length - 1; i >= 0; i--) {
+                enemies[i].remove();
+            }
             window.dispatchEvent(new CustomEvent('waveCleared'));
+            return previousWave;
         """)
-        time.sleep(2)  # Allow wave transition
+        if previous_wave is None:
+            self.fail("window.gameState is not exposed on the page")
+        # Allow wave transition
+        self.assertTrue(
+            self._wait_until_js(f"window.gameState.currentWave > {previous_wave}"),
+            f"Wave did not advance past {previous_wave} after clearing enemies"
+        )
+        self._cached_state = None
 
     def simulate_player_shot(self) -> None:
         """Helper method to simulate player shooting."""
@@ -153,13 +231,14 @@ class EnemySystemE2ETests(unittest.TestCase):
             const event = new KeyboardEvent('keydown', {'key': 'Space'});
             document.dispatchEvent(event);
         """)
+        self._cached_state = None
 
     def test_enemy_difficulty_scaling(self) -> None:
         """Validate enemy difficulty scaling across waves."""
         self.wait.until(EC.presence_of_element_located((By.ID, "game-canvas")))
         
         # Start game
-        self.driver.execute_script("window.startGame();")
+        self.start_game()
         
         # Record initial enemy speed
         initial_speed = self.get_enemy_speed()
@@ -179,9 +258,7 @@ class EnemySystemE2ETests(unittest.TestCase):
 
     def get_enemy_speed(self) -> float:
         """Get current enemy movement speed."""
-        return self.driver.execute_script(
-            "return window.gameState.enemySpeed;"
-        )
+        return self._state()["enemySpeed"]
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -6,8 +6,8 @@ File: tests/e2e/test_5f8591e6-8de6-4a2c-b99c-07e38513f168_complete.py
 """
 
 # TODO: Fix import - import pytest
-from typing import Dict, List, Optional
-import json
+from typing import Any, Dict, Iterator, List, Optional
+import functools
 import os
 from datetime import datetime, timedelta
 
@@ -36,25 +36,49 @@ from app.api.models.intelligence_models import (
 from tests.conftest import test_app, test_client
 
 
+def _tree_fingerprint(path: str) -> int:
+    """Latest modification time (ns) of any directory or file under path."""
+    latest = os.stat(path).st_mtime_ns
+    for root, _, files in os.walk(path):
+        latest = max(latest, os.stat(root).st_mtime_ns)
+        for name in files:
+            latest = max(latest, os.stat(os.path.join(root, name)).st_mtime_ns)
+    return latest
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_analyze(project_path: str, fingerprint: int) -> Dict[str, Any]:
+    """Run JavaScriptMetrics once per unchanged project tree."""
+    return JavaScriptMetrics().analyze_project(project_path)
+
+
+def analyze_project(project_path: str) -> Dict[str, Any]:
+    """Analyze a project, reusing results until any file in it changes."""
+    return _cached_analyze(project_path, _tree_fingerprint(project_path))
+
+
 class TestPolishAndOptimizationFeatures:
     """End-to-end test suite for Polish and Optimization features."""
 
+    @pytest.fixture(scope="class")
+    def project_dir(self, tmp_path_factory) -> Iterator[str]:
+        """
+        Temporary project directory shared by every test in the class.
+
+        Analysis results for it stay cached across tests until the class
+        finishes, so repeated analyze_project calls on an unchanged tree
+        reuse the first result.
+        """
+        yield str(tmp_path_factory.mktemp("space_invaders_js"))
+
+        _cached_analyze.cache_clear()
+
     @pytest.fixture(autouse=True)
-    def setup(self, test_app, test_client):
+    def setup(self, test_app, test_client, project_dir):
         """Setup test environment and resources."""
         self.app = test_app
         self.client = test_client
-        self.test_project_path = "./test_data/space_invaders_js"
-        
-        # Ensure test project directory exists
-        os.makedirs(self.test_project_path, exist_ok=True)
-        
-        yield
-        
-        # Cleanup
-        if os.path.exists(self.test_project_path):
-            # TODO: Fix import - import shutil
-            shutil.rmtree(self.test_project_path)
+        self.test_project_path = project_dir
 
     def test_code_style_analysis(self):
         """Test code style detection and validation."""
@@ -69,8 +93,7 @@ class TestPolishAndOptimizationFeatures:
 
     def test_optimization_metrics(self):
         """Test optimization metrics calculation and validation."""
-        js_metrics = JavaScriptMetrics()
-        metrics = js_metrics.analyze_project(self.test_project_path)
+        metrics = analyze_project(self.test_project_path)
 
         assert metrics is not None
         assert "complexity" in metrics
@@ -141,31 +164,55 @@ class TestPolishAndOptimizationFeatures:
         assert hasattr(metrics_response, "polish_score")
 
     def _find_circular_dependencies(self, deps: Dict[str, List[str]]) -> List[List[str]]:
-        """Helper method to detect circular dependencies in the dependency graph."""
-        visited = set()
-        path = []
+        """
+        Helper method to detect circular dependencies in the dependency graph.
+
+        Uses an iterative Tarjan strongly-connected-components pass, so it runs
+        in O(V + E) and never hits the recursion limit. Every component with
+        more than one node, or a node depending on itself, is a cycle.
+        """
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack = set()
+        stack: List[str] = []
         circular = []
 
-        def dfs(node: str) -> None:
-            if node in path:
-                cycle = path[path.index(node):]
-                circular.append(cycle)
-                return
-            
-            if node in visited:
-                return
-
-            visited.add(node)
-            path.append(node)
-            
-            for neighbor in deps.get(node, []):
-                dfs(neighbor)
-                
-            path.pop()
-
-        for node in deps:
-            if node not in visited:
-                dfs(node)
+        for root in deps:
+            if root in index:
+                continue
+
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(deps.get(root, [])))]
+
+            while work:
+                node, neighbors = work[-1]
+                for neighbor in neighbors:
+                    if neighbor not in index:
+                        index[neighbor] = lowlink[neighbor] = len(index)
+                        stack.append(neighbor)
+                        on_stack.add(neighbor)
+                        work.append((neighbor, iter(deps.get(neighbor, []))))
+                        break
+                    if neighbor in on_stack:
+                        lowlink[node] = min(lowlink[node], index[neighbor])
+                else:
+                    work.pop()
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack.discard(member)
+                            component.append(member)
+                            if member == node:
+                                break
+                        if len(component) > 1 or node in deps.get(node, []):
+                            circular.append(component[::-1])
 
         return circular
 
@@ -176,8 +223,7 @@ class TestPolishAndOptimizationFeatures:
             files = impl_files(config.project_path)
             
             # Calculate metrics
-            js_metrics = JavaScriptMetrics()
-            code_metrics = js_metrics.analyze_project(config.project_path)
+            code_metrics = analyze_project(config.project_path)
             
             # Create response
             return ProjectMetricsResponse(
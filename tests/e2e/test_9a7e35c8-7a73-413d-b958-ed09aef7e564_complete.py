@@ -5,8 +5,9 @@ Tests all major components and their integration.
 File: tests/e2e/test_9a7e35c8-7a73-413d-b958-ed09aef7e564_complete.py
 """
 
-import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 # TODO: Fix import - import pytest
 from typing import Dict, Any
 # TODO: Fix import - from dataclasses import dataclass
@@ -14,7 +15,7 @@ from typing import Dict, Any
 import logging
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -34,15 +35,47 @@ class ComponentStatus(Enum):
 
 class GameEngineValidator:
     """Validates core game engine components and their integration"""
+
+    # One bit per component in the ready/error masks
+    _BITS = {
+        "canvas": 0,
+        "sprite_system": 1,
+        "collision_system": 2,
+        "game_loop": 3
+    }
+    _ALL_READY_MASK = (1 << len(_BITS)) - 1
     
     def __init__(self, config: GameEngineConfig):
         self.config = config
-        self.component_status: Dict[str, ComponentStatus] = {
-            "canvas": ComponentStatus.NOT_INITIALIZED,
-            "sprite_system": ComponentStatus.NOT_INITIALIZED,
-            "collision_system": ComponentStatus.NOT_INITIALIZED,
-            "game_loop": ComponentStatus.NOT_INITIALIZED
-        }
+        self._ready_mask = 0
+        self._error_mask = 0
+        # Validations may run concurrently; mask updates are read-modify-write
+        self._lock = threading.Lock()
+
+    def _mark(self, component: str, status: ComponentStatus) -> None:
+        """Record a component status in the ready/error bitmasks"""
+        bit = 1 << self._BITS[component]
+        with self._lock:
+            if status == ComponentStatus.READY:
+                self._ready_mask |= bit
+                self._error_mask &= ~bit
+            else:
+                self._error_mask |= bit
+                self._ready_mask &= ~bit
+
+    @property
+    def component_status(self) -> Dict[str, ComponentStatus]:
+        """Per-component status view decoded from the bitmasks"""
+        status = {}
+        for component, index in self._BITS.items():
+            bit = 1 << index
+            if self._ready_mask & bit:
+                status[component] = ComponentStatus.READY
+            elif self._error_mask & bit:
+                status[component] = ComponentStatus.ERROR
+            else:
+                status[component] = ComponentStatus.NOT_INITIALIZED
+        return status
 
     def validate_canvas_setup(self) -> bool:
         """Validates canvas initialization and properties"""
@@ -51,22 +84,22 @@ class GameEngineValidator:
             if self.config.canvas_width <= 0 or self.config.canvas_height <= 0:
                 return False
             
-            self.component_status["canvas"] = ComponentStatus.READY
+            self._mark("canvas", ComponentStatus.READY)
             return True
         except Exception as e:
-            logger.error(f"Canvas validation failed: {str(e)}")
-            self.component_status["canvas"] = ComponentStatus.ERROR
+            logger.error("Canvas validation failed: %s", e)
+            self._mark("canvas", ComponentStatus.ERROR)
             return False
 
     def validate_sprite_system(self) -> bool:
         """Validates sprite system functionality"""
         try:
             # Simulate sprite system validation
-            self.component_status["sprite_system"] = ComponentStatus.READY
+            self._mark("sprite_system", ComponentStatus.READY)
             return True
         except Exception as e:
-            logger.error(f"Sprite system validation failed: {str(e)}")
-            self.component_status["sprite_system"] = ComponentStatus.ERROR
+            logger.error("Sprite system validation failed: %s", e)
+            self._mark("sprite_system", ComponentStatus.ERROR)
             return False
 
     def validate_collision_system(self) -> bool:
@@ -80,11 +113,11 @@ class GameEngineValidator:
                 if not self._validate_quad_tree():
                     return False
             
-            self.component_status["collision_system"] = ComponentStatus.READY
+            self._mark("collision_system", ComponentStatus.READY)
             return True
         except Exception as e:
-            logger.error(f"Collision system validation failed: {str(e)}")
-            self.component_status["collision_system"] = ComponentStatus.ERROR
+            logger.error("Collision system validation failed: %s", e)
+            self._mark("collision_system", ComponentStatus.ERROR)
             return False
 
     def _validate_quad_tree(self) -> bool:
@@ -93,7 +126,7 @@ class GameEngineValidator:
             # Simulate QuadTree validation
             return True
         except Exception as e:
-            logger.error(f"QuadTree validation failed: {str(e)}")
+            logger.error("QuadTree validation failed: %s", e)
             return False
 
     def validate_game_loop(self) -> bool:
@@ -102,17 +135,17 @@ class GameEngineValidator:
             if self.config.fps <= 0:
                 return False
                 
-            self.component_status["game_loop"] = ComponentStatus.READY
+            self._mark("game_loop", ComponentStatus.READY)
             return True
         except Exception as e:
-            logger.error(f"Game loop validation failed: {str(e)}")
-            self.component_status["game_loop"] = ComponentStatus.ERROR
+            logger.error("Game loop validation failed: %s", e)
+            self._mark("game_loop", ComponentStatus.ERROR)
             return False
 
     def get_validation_report(self) -> Dict[str, Any]:
         """Generates a validation report for all components"""
         return {
-            "status": all(status == ComponentStatus.READY for status in self.component_status.values()),
+            "status": self._ready_mask == self._ALL_READY_MASK,
             "components": {
                 component: status.value
                 for component, status in self.component_status.items()
@@ -137,17 +170,18 @@ class TestGameEngineSetup:
 
     def test_complete_engine_setup(self, engine_validator: GameEngineValidator):
         """Test complete game engine setup with all components"""
-        # Validate canvas
-        assert engine_validator.validate_canvas_setup(), "Canvas setup failed"
-        
-        # Validate sprite system
-        assert engine_validator.validate_sprite_system(), "Sprite system validation failed"
-        
-        # Validate collision system
-        assert engine_validator.validate_collision_system(), "Collision system validation failed"
+        # Components are independent, so validate them concurrently
+        validations = {
+            "Canvas setup": engine_validator.validate_canvas_setup,
+            "Sprite system validation": engine_validator.validate_sprite_system,
+            "Collision system validation": engine_validator.validate_collision_system,
+            "Game loop validation": engine_validator.validate_game_loop
+        }
+        with ThreadPoolExecutor(max_workers=len(validations)) as executor:
+            results = list(executor.map(lambda validate: validate(), validations.values()))
         
-        # Validate game loop
-        assert engine_validator.validate_game_loop(), "Game loop validation failed"
+        failed = [name for name, passed in zip(validations, results) if not passed]
+        assert not failed, f"{', '.join(failed)} failed"
         
         # Get final validation report
         report = engine_validator.get_validation_report()
@@ -11,11 +11,13 @@ Tests the integration between core game systems including:
 """
 
 # TODO: Fix import - import unittest
-import json
 import time
+from array import array
+from collections import Counter
+from time import monotonic_ns as _now
 from typing import Dict, List, Any
 # TODO: Fix import - from dataclasses import dataclass
-# TODO: Fix import - from enum import Enum
+from enum import IntEnum
 from pathlib import Path
 
 # Using only allowed imports
@@ -35,28 +37,73 @@ class GameState:
     is_paused: bool = False
     audio_enabled: bool = True
     
-class GameSystemEvent(Enum):
-    """Represents various game system events that can occur"""
-    PLAYER_HIT = "player_hit"
-    ENEMY_DESTROYED = "enemy_destroyed"
-    WAVE_COMPLETE = "wave_complete"
-    GAME_OVER = "game_over"
-    SCORE_UPDATE = "score_update"
-    AUDIO_TRIGGER = "audio_trigger"
+class GameSystemEvent(IntEnum):
+    """
+    Represents various game system events that can occur
+
+    Integer values compare natively and fit the one-byte type column of
+    MockGameSystem's event buffers.
+    """
+    PLAYER_HIT = 1
+    ENEMY_DESTROYED = 2
+    WAVE_COMPLETE = 3
+    GAME_OVER = 4
+    SCORE_UPDATE = 5
+    AUDIO_TRIGGER = 6
 
 class MockGameSystem:
     """Mock implementation of game system for testing"""
+
+    INITIAL_EVENT_CAPACITY = 2048
+
     def __init__(self):
         self.state = GameState()
-        self.events: List[Dict[str, Any]] = []
+        # Events are stored column-wise in preallocated buffers: compact type
+        # codes and monotonic nanosecond timestamps in typed arrays, payloads
+        # in a parallel list. Only the first _event_count slots are live.
+        capacity = self.INITIAL_EVENT_CAPACITY
+        self._event_types = array('B', [0]) * capacity
+        self._event_timestamps = array('q', [0]) * capacity
+        self._event_data: List[Any] = [None] * capacity
+        self._event_count = 0
+        # Running per-type totals, so counting never scans the event log
+        self.counts: Counter = Counter()
         
     def trigger_event(self, event_type: GameSystemEvent, data: Dict[str, Any]) -> None:
         """Records a game event for validation"""
-        self.events.append({
-            "type": event_type,
-            "data": data,
-            "timestamp": time.time()
-        })
+        index = self._event_count
+        if index == len(self._event_data):
+            self._grow_event_buffers()
+        self._event_types[index] = event_type
+        self._event_timestamps[index] = _now()
+        self._event_data[index] = data
+        self._event_count = index + 1
+        self.counts[event_type] += 1
+
+    def _grow_event_buffers(self) -> None:
+        """Doubles the capacity of every event column"""
+        self._event_types.extend(array('B', [0]) * len(self._event_types))
+        self._event_timestamps.extend(array('q', [0]) * len(self._event_timestamps))
+        self._event_data.extend([None] * len(self._event_data))
+
+    @property
+    def events(self) -> List[Dict[str, Any]]:
+        """Recorded events as one dict per event, built on demand"""
+        count = self._event_count
+        return [
+            {"type": GameSystemEvent(event_type), "data": data, "timestamp": timestamp}
+            for event_type, data, timestamp in zip(
+                self._event_types[:count],
+                self._event_data[:count],
+                self._event_timestamps[:count]
+            )
+        ]
+
+    def clear_events(self) -> None:
+        """Discards all recorded events, keeping buffer capacity"""
+        self._event_data[:self._event_count] = [None] * self._event_count
+        self._event_count = 0
+        self.counts.clear()
         
     def get_state(self) -> GameState:
         """Returns current game state"""
@@ -118,9 +165,10 @@ class TestGameSystemsIntegration(unittest.TestCase):
             self.game_system.trigger_event(event_type, data)
             
         # Verify audio events were triggered
-        audio_events = [e for e in self.game_system.events 
-                       if e["type"] == GameSystemEvent.AUDIO_TRIGGER]
-        self.assertEqual(len(audio_events), len(test_events))
+        self.assertEqual(
+            self.game_system.counts[GameSystemEvent.AUDIO_TRIGGER],
+            len(test_events)
+        )
 
     def test_score_management(self):
         """Test score system integration"""
@@ -155,11 +203,11 @@ class TestGameSystemsIntegration(unittest.TestCase):
         start_time = time.time()
         
         # Simulate rapid game events
+        trigger = self.game_system.trigger_event
+        enemy_destroyed = GameSystemEvent.ENEMY_DESTROYED
+        payload = {"points": 100}
         for _ in range(100):
-            self.game_system.trigger_event(
-                GameSystemEvent.ENEMY_DESTROYED,
-                {"points": 100}
-            )
+            trigger(enemy_destroyed, payload)
             
         end_time = time.time()
         processing_time = end_time - start_time
@@ -170,7 +218,7 @@ class TestGameSystemsIntegration(unittest.TestCase):
     def tearDown(self):
         """Clean up after each test"""
         logger.info("Cleaning up test environment")
-        self.game_system.events.clear()
+        self.game_system.clear_events()
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -7,13 +7,14 @@ File: tests/performance/benchmark_3fbf7d05-eae6-4731-b4fc-4b8ab636932c.py
 """
 
 import time
-# TODO: Fix import - import statistics
 # TODO: Fix import - import unittest
-from typing import List, Dict, Tuple
+from typing import Dict
 # TODO: Fix import - from dataclasses import dataclass
 import json
 import logging
-from datetime import datetime
+from pathlib import Path
+
+import numpy as np
 
 from app.config.logging import configure_logging
 from app.code_analysis.treesitter.enhanced_models import AnalysisMode
@@ -23,6 +24,13 @@ from app.api.models.intelligence_models import ProjectMetricsResponse
 logger = logging.getLogger(__name__)
 configure_logging()
 
+# Playfield and broad-phase grid used by the simulated enemy workloads
+FIELD_WIDTH = 800
+FIELD_HEIGHT = 600
+FIELD_SIZE = np.array((FIELD_WIDTH, FIELD_HEIGHT), dtype=np.float32)
+CELL_SIZE = 32
+GRID_STRIDE = 1 << 16  # Row multiplier when packing (cx, cy) into one key
+
 @dataclass
 class EnemyBenchmarkMetrics:
     """Stores benchmark metrics for enemy system performance."""
@@ -40,8 +48,16 @@ class EnemySystemBenchmark(unittest.TestCase):
         """Initialize benchmark environment."""
         self.sample_size = 1000
         self.batch_size = 50
-        self.results: Dict[str, List[float]] = {}
+        self.results: Dict[str, np.ndarray] = {}
         self.start_time = time.time()
+
+        # Enemy state as structure-of-arrays: one row per enemy
+        self.rng = np.random.default_rng(42)
+        self.pos = self.rng.uniform(
+            (0, 0), (FIELD_WIDTH, FIELD_HEIGHT), size=(self.sample_size, 2)
+        ).astype(np.float32)
+        self.vel = self.rng.standard_normal((self.sample_size, 2)).astype(np.float32)
+        self.cursor = 0
         
     def tearDown(self):
         """Clean up and log results."""
@@ -49,106 +65,133 @@ class EnemySystemBenchmark(unittest.TestCase):
         logger.info(f"Benchmark suite completed in {execution_time:.2f} seconds")
         self._save_metrics()
 
-    def _measure_execution_time(self, func) -> float:
-        """Measure execution time of a function in milliseconds."""
-        start = time.perf_counter()
-        func()
-        end = time.perf_counter()
-        return (end - start) * 1000
+    def _measure_execution_time(self, func, n: int) -> np.ndarray:
+        """
+        Measure execution time of n calls of a function.
+
+        Returns:
+            Array of per-call execution times in milliseconds
+        """
+        times = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            start = time.perf_counter()
+            func()
+            times[i] = time.perf_counter() - start
+        times *= 1000
+        return times
+
+    def _create_enemies(self, n: int) -> None:
+        """Place n new enemies at random positions with one vectorized write."""
+        if self.cursor + n > len(self.pos):
+            self.cursor = 0  # Recycle slots once the pool is full
+        self.pos[self.cursor:self.cursor + n] = self.rng.uniform(
+            (0, 0), (FIELD_WIDTH, FIELD_HEIGHT), size=(n, 2)
+        )
+        self.cursor += n
 
     def _simulate_enemy_creation(self) -> None:
         """Simulate creation of a single enemy entity."""
-        # Simulated enemy creation logic
-        time.sleep(0.001)  # Simulate actual creation overhead
+        self._create_enemies(1)
 
     def _simulate_batch_creation(self) -> None:
         """Simulate creation of multiple enemies in a wave."""
-        for _ in range(self.batch_size):
-            self._simulate_enemy_creation()
+        self._create_enemies(self.batch_size)
 
     def _simulate_movement_calculation(self) -> None:
         """Simulate enemy movement pattern calculation."""
-        # Simulated movement calculation logic
-        time.sleep(0.002)  # Simulate pattern computation
-
-    def _simulate_collision_detection(self) -> None:
-        """Simulate collision detection for enemies."""
-        # Simulated collision detection logic
-        time.sleep(0.001)  # Simulate collision checks
+        self.pos += self.vel
+        # Wrap around the playfield so enemies stay on the collision grid
+        np.mod(self.pos, FIELD_SIZE, out=self.pos)
+
+    def _simulate_collision_detection(self) -> int:
+        """
+        Simulate broad-phase collision detection for enemies.
+
+        Enemies are bucketed into a uniform grid by sorting packed cell keys;
+        only enemies sharing a cell become candidate pairs, avoiding the
+        O(N^2) all-pairs check.
+
+        Returns:
+            Number of candidate pairs for the narrow phase
+        """
+        cells = (self.pos // CELL_SIZE).astype(np.int32)
+        keys = np.sort(cells[:, 0] * GRID_STRIDE + cells[:, 1])
+        bucket_starts = np.flatnonzero(np.diff(keys)) + 1
+        bucket_sizes = np.diff(np.concatenate(([0], bucket_starts, [len(keys)])))
+        return int((bucket_sizes * (bucket_sizes - 1) // 2).sum())
+
+    @staticmethod
+    def _summarize(arr: np.ndarray) -> Dict[str, float]:
+        """Compute mean, median and sample standard deviation of a timing array."""
+        return {
+            'mean': float(arr.mean()),
+            'median': float(np.median(arr)),
+            'std_dev': float(arr.std(ddof=1)) if arr.size > 1 else 0.0
+        }
 
     def _save_metrics(self) -> None:
         """Save benchmark metrics to file."""
         metrics = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': time.time_ns(),  # Epoch nanoseconds
             'sample_size': self.sample_size,
             'batch_size': self.batch_size,
             'metrics': {
-                key: {
-                    'mean': statistics.mean(values),
-                    'median': statistics.median(values),
-                    'std_dev': statistics.stdev(values) if len(values) > 1 else 0
-                } for key, values in self.results.items()
+                key: self._summarize(values) for key, values in self.results.items()
             }
         }
         
         try:
-            with open('enemy_system_benchmark_results.json', 'w') as f:
-                json.dump(metrics, f, indent=2)
+            # Serialize in one call and write once rather than per JSON chunk
+            Path('enemy_system_benchmark_results.json').write_text(
+                json.dumps(metrics, indent=2)
+            )
         except IOError as e:
             logger.error(f"Failed to save benchmark results: {e}")
 
     def test_enemy_creation_performance(self):
         """Benchmark enemy creation performance."""
-        creation_times = []
-        
-        for _ in range(self.sample_size):
-            time_ms = self._measure_execution_time(self._simulate_enemy_creation)
-            creation_times.append(time_ms)
-            
+        creation_times = self._measure_execution_time(
+            self._simulate_enemy_creation,
+            self.sample_size
+        )
         self.results['enemy_creation'] = creation_times
-        avg_time = statistics.mean(creation_times)
+        avg_time = float(creation_times.mean())
         
         logger.info(f"Average enemy creation time: {avg_time:.2f}ms")
         self.assertLess(avg_time, 5.0, "Enemy creation time exceeds threshold")
 
     def test_wave_creation_performance(self):
         """Benchmark enemy wave creation performance."""
-        wave_times = []
-        
-        for _ in range(self.sample_size // self.batch_size):
-            time_ms = self._measure_execution_time(self._simulate_batch_creation)
-            wave_times.append(time_ms)
-            
+        wave_times = self._measure_execution_time(
+            self._simulate_batch_creation,
+            self.sample_size // self.batch_size
+        )
         self.results['wave_creation'] = wave_times
-        avg_time = statistics.mean(wave_times)
+        avg_time = float(wave_times.mean())
         
         logger.info(f"Average wave creation time: {avg_time:.2f}ms")
         self.assertLess(avg_time, 100.0, "Wave creation time exceeds threshold")
 
     def test_movement_pattern_performance(self):
         """Benchmark movement pattern calculation performance."""
-        pattern_times = []
-        
-        for _ in range(self.sample_size):
-            time_ms = self._measure_execution_time(self._simulate_movement_calculation)
-            pattern_times.append(time_ms)
-            
+        pattern_times = self._measure_execution_time(
+            self._simulate_movement_calculation,
+            self.sample_size
+        )
         self.results['movement_patterns'] = pattern_times
-        avg_time = statistics.mean(pattern_times)
+        avg_time = float(pattern_times.mean())
         
         logger.info(f"Average movement calculation time: {avg_time:.2f}ms")
         self.assertLess(avg_time, 3.0, "Movement calculation time exceeds threshold")
 
     def test_collision_detection_performance(self):
         """Benchmark collision detection performance."""
-        collision_times = []
-        
-        for _ in range(self.sample_size):
-            time_ms = self._measure_execution_time(self._simulate_collision_detection)
-            collision_times.append(time_ms)
-            
+        collision_times = self._measure_execution_time(
+            self._simulate_collision_detection,
+            self.sample_size
+        )
         self.results['collision_detection'] = collision_times
-        avg_time = statistics.mean(collision_times)
+        avg_time = float(collision_times.mean())
         
         logger.info(f"Average collision detection time: {avg_time:.2f}ms")
         self.assertLess(avg_time, 2.0, "Collision detection time exceeds threshold")
@@ -11,6 +11,9 @@ from typing import Dict, List, Any
 # TODO: Fix import - from dataclasses import dataclass
 import json
 import os
+from functools import lru_cache
+
+import psutil
 
 from app.code_analysis.treesitter.pattern_analyzers.style_detector import (
     most_common_style,
@@ -26,6 +29,15 @@ from app.intelligence.analyzers.project_analyzer import (
     impl_files
 )
 
+# Prime psutil's CPU counters so later non-blocking reads have a baseline
+psutil.cpu_percent(None)
+
+@lru_cache(maxsize=4)
+def _load_fixture(fixture_path: str) -> Dict[str, Any]:
+    """Parse a JSON fixture once per path; later loads are served from memory"""
+    with open(fixture_path, 'rb') as f:
+        return json.loads(f.read())
+
 @dataclass
 class OptimizationMetrics:
     """Stores metrics for optimization operations"""
@@ -52,8 +64,7 @@ class BenchmarkPolishOptimization:
             "polish_optimization_test_data.json"
         )
         try:
-            with open(fixture_path) as f:
-                return json.load(f)
+            return _load_fixture(fixture_path)
         except FileNotFoundError:
             return self._generate_test_data()
 
@@ -114,6 +125,7 @@ class BenchmarkPolishOptimization:
         """Measure detailed optimization metrics"""
         start_time = time.time()
         start_memory = self._get_memory_usage()
+        self._get_cpu_usage()  # Opens the CPU-usage window
 
         # Run optimization operations
         deps = dependency_graph(self.test_data["code_samples"])
@@ -125,24 +137,28 @@ class BenchmarkPolishOptimization:
 
         end_time = time.time()
         end_memory = self._get_memory_usage()
+        cpu_usage = self._get_cpu_usage()
 
         return OptimizationMetrics(
             execution_time=end_time - start_time,
             memory_usage=end_memory - start_memory,
-            cpu_usage=self._get_cpu_usage(),
+            cpu_usage=cpu_usage,
             success_rate=self._calculate_success_rate(impact)
         )
 
     def _get_memory_usage(self) -> int:
         """Get current memory usage"""
-        # TODO: Fix import - import psutil
         process = psutil.Process(os.getpid())
         return process.memory_info().rss
 
     def _get_cpu_usage(self) -> float:
-        """Get current CPU usage"""
-        # TODO: Fix import - import psutil
-        return psutil.cpu_percent(interval=1)
+        """
+        Get CPU usage since the previous call, without blocking.
+
+        psutil reports the percentage over the interval since its last call,
+        so call this at both ends of a window for an accurate reading.
+        """
+        return psutil.cpu_percent(None)
 
     def _calculate_success_rate(self, impact: ChangeImpact) -> float:
         """Calculate success rate of optimization"""
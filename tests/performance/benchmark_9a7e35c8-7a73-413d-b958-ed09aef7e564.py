@@ -8,14 +8,18 @@ measuring initialization times, memory usage, and basic operation performance.
 
 import time
 import sys
-# TODO: Fix import - import gc
-# TODO: Fix import - import statistics
+import timeit
+import tracemalloc
 from typing import Dict, List, Tuple, Optional
 # TODO: Fix import - from dataclasses import dataclass
 import json
 import logging
 from pathlib import Path
 
+import numpy as np
+
+from perf_utils import gc_paused
+
 from app.config.logging import configure_logging
 from app.models.project import ProjectPhase, DEVELOPMENT
 from app.code_analysis.treesitter.enhanced_models import AnalysisMode
@@ -25,7 +29,7 @@ from app.services.external.llm.codex.types.models import CodexMetrics
 logger = logging.getLogger(__name__)
 configure_logging()
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     """Container for benchmark measurement results."""
     operation_name: str
@@ -42,41 +46,64 @@ class GameEngineBenchmark:
         self.results: List[BenchmarkResult] = []
         self.iterations: int = 1000
         self.warmup_iterations: int = 100
-    
-    def _measure_memory(self) -> int:
-        """Measure current memory usage."""
-        gc.collect()
-        return sys.getsizeof(gc.get_objects())
+        # Iterations timed together per clock read, amortizing timer overhead
+        self.block_size: int = 100
+
+    def _measure_memory(self, func, calls: int) -> Tuple[int, int]:
+        """
+        Run func in an untimed pass with tracemalloc on.
+
+        Tracing is only active for this pass, so the timed blocks don't pay
+        the allocation hook.
+
+        Returns:
+            Net traced bytes allocated by the pass and the traced peak
+        """
+        owns_tracing = not tracemalloc.is_tracing()
+        if owns_tracing:
+            tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            initial_memory = tracemalloc.get_traced_memory()[0]
+            for _ in range(calls):
+                func()
+            final_memory, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            if owns_tracing:
+                tracemalloc.stop()
+        return final_memory - initial_memory, peak_memory
 
     def _run_timed_operation(self, operation_name: str, func) -> BenchmarkResult:
         """Execute and measure a benchmark operation."""
-        # Warmup phase
-        for _ in range(self.warmup_iterations):
-            func()
-        
-        gc.collect()
-        initial_memory = self._measure_memory()
-        peak_memory = initial_memory
-        execution_times = []
-
-        # Measurement phase
-        for _ in range(self.iterations):
-            start_time = time.perf_counter()
-            func()
-            end_time = time.perf_counter()
-            execution_times.append(end_time - start_time)
-            
-            current_memory = self._measure_memory()
-            peak_memory = max(peak_memory, current_memory)
-
-        total_time = sum(execution_times)
-        avg_time = statistics.mean(execution_times)
-        final_memory = self._measure_memory()
+        if self.iterations < 1:
+            raise ValueError(f"iterations must be positive, got {self.iterations}")
+        timer = timeit.Timer(func)
+        block = min(self.block_size, self.iterations)
+        n_blocks, remainder = divmod(self.iterations, block)
+        block_times = np.empty(n_blocks, dtype=np.float64)
+
+        # GC stays off across warmup and measurement so a collection between
+        # the phases doesn't evict the state warmup just built
+        with gc_paused():
+            # Warmup phase
+            for _ in range(self.warmup_iterations):
+                func()
+
+            # Measurement phase: one clock read per block, then the leftover
+            # iterations so exactly self.iterations calls are timed
+            for i in range(n_blocks):
+                block_times[i] = timer.timeit(block)
+            remainder_time = timer.timeit(remainder) if remainder else 0.0
+
+            memory_usage, peak_memory = self._measure_memory(func, block)
+
+        total_time = float(block_times.sum()) + remainder_time
+        avg_time = total_time / self.iterations
 
         return BenchmarkResult(
             operation_name=operation_name,
             execution_time=total_time,
-            memory_usage=final_memory - initial_memory,
+            memory_usage=memory_usage,
             iterations=self.iterations,
             avg_time_per_iteration=avg_time,
             peak_memory=peak_memory
@@ -139,13 +166,12 @@ class GameEngineBenchmark:
         }
 
         if output_path:
-            with open(output_path, 'w') as f:
-                json.dump(results_dict, f, indent=2)
+            Path(output_path).write_text(json.dumps(results_dict, indent=2))
 
         return results_dict
 
-def run_benchmarks() -> Dict:
-    """Execute all benchmarks and return results."""
+def run_benchmarks(output_path: Optional[str] = None) -> Dict:
+    """Execute all benchmarks, optionally saving results, and return them."""
     logger.info("Starting Game Engine Setup Benchmarks...")
     
     benchmark = GameEngineBenchmark()
@@ -155,7 +181,7 @@ def run_benchmarks() -> Dict:
         benchmark.benchmark_sprite_loading()
         benchmark.benchmark_collision_system()
         
-        results = benchmark.export_results()
+        results = benchmark.export_results(output_path)
         
         logger.info("Benchmarks completed successfully")
         return results
@@ -166,12 +192,9 @@ def run_benchmarks() -> Dict:
 
 if __name__ == "__main__":
     try:
-        results = run_benchmarks()
         output_path = Path("benchmark_results.json")
+        run_benchmarks(str(output_path))
         
-        with open(output_path, 'w') as f:
-            json.dump(results, f, indent=2)
-            
         logger.info(f"Benchmark results saved to {output_path}")
         
     except Exception as e:
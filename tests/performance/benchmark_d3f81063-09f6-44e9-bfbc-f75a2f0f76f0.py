@@ -5,8 +5,8 @@ Tests response times and efficiency of player input handling and movement system
 File: tests/performance/benchmark_d3f81063-09f6-44e9-bfbc-f75a2f0f76f0.py
 """
 
+import os
 import time
-# TODO: Fix import - import statistics
 # TODO: Fix import - import unittest
 from typing import List, Dict, Tuple
 # TODO: Fix import - from dataclasses import dataclass
@@ -14,11 +14,17 @@ import json
 import logging
 from datetime import datetime
 
+import numpy as np
+
+from perf_utils import (
+    calibrate_iterations, gc_paused, pin_cpu, restore_cpu_affinity
+)
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MovementMetrics:
     """Data class to store movement performance metrics"""
     input_latency: float  # ms
@@ -30,16 +36,46 @@ class MovementMetrics:
 class PlayerControlsBenchmark(unittest.TestCase):
     """Benchmark suite for player controls and movement systems"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up read-only benchmark configuration shared by all tests"""
+        # Seconds of measured work per test; sample counts are calibrated
+        # from it
+        cls.time_budget = 0.5
+        # Every result record of this run carries the same timestamp
+        cls._suite_ts = datetime.now().isoformat()
+        
+        # Test configuration
+        cls.input_types = ['keyboard', 'touch']
+        cls.movement_directions = ['left', 'right', 'shoot']
+        cls.frame_target = 1/60  # 60 FPS target
+
+        # Synthetic work is a calibrated busy-spin rather than time.sleep, so
+        # the numbers reflect CPU time instead of scheduler wakeup jitter
+        # Registered right away so the pin is released even if the rest of
+        # setUpClass raises and tearDownClass never runs
+        cls.addClassCleanup(restore_cpu_affinity, pin_cpu())
+        cls._spin100us = cls._calibrate_spin(0.0001)
+
+        # Results from every test, written in one go by tearDownClass
+        cls._pending_results: List[Dict] = []
+
+    @classmethod
+    def tearDownClass(cls):
+        """Write the buffered results"""
+        cls._flush_benchmark_results()
+
     def setUp(self):
-        """Set up benchmark environment and configurations"""
-        self.sample_size = 1000
+        """Set up per-test benchmark state"""
         self.movement_metrics: List[MovementMetrics] = []
         self.benchmark_start_time = time.time()
-        
-        # Test configuration
-        self.input_types = ['keyboard', 'touch']
-        self.movement_directions = ['left', 'right', 'shoot']
-        self.frame_target = 1/60  # 60 FPS target
+        self.sample_size = 0
+
+        # Prime the simulated workloads before any timed loop
+        for _ in range(50):
+            self._simulate_input_processing()
+            self._simulate_movement_processing()
+            self._simulate_collision_check()
 
     def tearDown(self):
         """Clean up and log benchmark results"""
@@ -48,72 +84,105 @@ class PlayerControlsBenchmark(unittest.TestCase):
 
     def test_input_response_time(self):
         """Benchmark input detection and response times"""
-        metrics = []
+        self.sample_size = calibrate_iterations(self._simulate_input_processing, self.time_budget)
+        metrics = np.empty(self.sample_size, dtype=np.int64)
+        perf_counter_ns = time.perf_counter_ns
         
-        for _ in range(self.sample_size):
-            start_time = time.perf_counter()
+        with gc_paused():
+            for i in range(self.sample_size):
+                start_time = perf_counter_ns()
             
-            # Simulate input processing
-            self._simulate_input_processing()
+                # Simulate input processing
+                self._simulate_input_processing()
             
-            end_time = time.perf_counter()
-            metrics.append((end_time - start_time) * 1000)  # Convert to ms
+                end_time = perf_counter_ns()
+                metrics[i] = end_time - start_time
             
         self._analyze_metrics("Input Response", metrics)
 
     def test_movement_processing(self):
         """Benchmark movement calculation and update times"""
-        metrics = []
+        self.sample_size = calibrate_iterations(self._simulate_movement_processing, self.time_budget)
+        metrics = np.empty(self.sample_size, dtype=np.int64)
+        perf_counter_ns = time.perf_counter_ns
         
-        for _ in range(self.sample_size):
-            start_time = time.perf_counter()
+        with gc_paused():
+            for i in range(self.sample_size):
+                start_time = perf_counter_ns()
             
-            # Simulate movement processing
-            self._simulate_movement_processing()
+                # Simulate movement processing
+                self._simulate_movement_processing()
             
-            end_time = time.perf_counter()
-            metrics.append((end_time - start_time) * 1000)  # Convert to ms
+                end_time = perf_counter_ns()
+                metrics[i] = end_time - start_time
             
         self._analyze_metrics("Movement Processing", metrics)
 
     def test_combined_input_movement_pipeline(self):
         """Benchmark complete input-to-movement pipeline"""
-        metrics = []
-        
-        for _ in range(self.sample_size):
-            start_time = time.perf_counter()
-            
-            # Simulate complete pipeline
+        def pipeline():
             self._simulate_input_processing()
             self._simulate_movement_processing()
             self._simulate_collision_check()
+
+        self.sample_size = calibrate_iterations(pipeline, self.time_budget)
+        metrics = np.empty(self.sample_size, dtype=np.int64)
+        perf_counter_ns = time.perf_counter_ns
+        
+        with gc_paused():
+            for i in range(self.sample_size):
+                start_time = perf_counter_ns()
             
-            end_time = time.perf_counter()
-            metrics.append((end_time - start_time) * 1000)  # Convert to ms
+                # Simulate complete pipeline
+                self._simulate_input_processing()
+                self._simulate_movement_processing()
+                self._simulate_collision_check()
+            
+                end_time = perf_counter_ns()
+                metrics[i] = end_time - start_time
             
         self._analyze_metrics("Complete Pipeline", metrics)
 
+    @staticmethod
+    def _calibrate_spin(target_seconds: float, probe: int = 100_000) -> int:
+        """Return the spin-loop iteration count that takes target_seconds"""
+        x = 1.0
+        start_time = time.perf_counter()
+        for _ in range(probe):
+            x *= 1.000001
+        elapsed = time.perf_counter() - start_time
+        return max(1, int(probe * target_seconds / elapsed))
+
     def _simulate_input_processing(self) -> None:
         """Simulate input detection and processing"""
-        # Simulate input processing overhead
-        time.sleep(0.0001)  # 0.1ms synthetic delay
+        # Simulate input processing overhead (~0.1ms of CPU work)
+        x = 1.0
+        for _ in range(self._spin100us):
+            x *= 1.000001
 
     def _simulate_movement_processing(self) -> None:
         """Simulate movement calculations"""
-        # Simulate movement calculation overhead
-        time.sleep(0.0002)  # 0.2ms synthetic delay
+        # Simulate movement calculation overhead (~0.2ms of CPU work)
+        x = 1.0
+        for _ in range(self._spin100us * 2):
+            x *= 1.000001
 
     def _simulate_collision_check(self) -> None:
         """Simulate collision detection"""
-        # Simulate collision detection overhead
-        time.sleep(0.0001)  # 0.1ms synthetic delay
-
-    def _analyze_metrics(self, test_name: str, metrics: List[float]) -> None:
-        """Analyze and store benchmark metrics"""
-        mean = statistics.mean(metrics)
-        median = statistics.median(metrics)
-        stdev = statistics.stdev(metrics)
-        p95 = sorted(metrics)[int(len(metrics) * 0.95)]
+        # Simulate collision detection overhead (~0.1ms of CPU work)
+        x = 1.0
+        for _ in range(self._spin100us):
+            x *= 1.000001
+
+    def _analyze_metrics(self, test_name: str, metrics: np.ndarray) -> None:
+        """Analyze and store benchmark metrics (samples in integer ns)"""
+        samples = metrics / 1e6  # ns -> ms
+        mean = float(samples.mean())
+        median = float(np.median(samples))
+        stdev = float(samples.std(ddof=1))
+        # Nearest-rank p95 via introselect; no full sort needed
+        k = int(samples.size * 0.95)
+        p95 = float(np.partition(samples, k)[k])
         
         results = {
             "test_name": test_name,
@@ -121,8 +190,8 @@ class PlayerControlsBenchmark(unittest.TestCase):
             "median_ms": round(median, 3),
             "stdev_ms": round(stdev, 3),
             "p95_ms": round(p95, 3),
-            "sample_size": len(metrics),
-            "timestamp": datetime.now().isoformat()
+            "sample_size": samples.size,
+            "timestamp": self._suite_ts
         }
         
         logger.info(f"\n{test_name} Benchmark Results:")
@@ -134,13 +203,26 @@ class PlayerControlsBenchmark(unittest.TestCase):
         self._save_benchmark_results(results)
 
     def _save_benchmark_results(self, results: Dict) -> None:
-        """Save benchmark results to file"""
+        """Queue benchmark results; they are written once in tearDownClass"""
+        self._pending_results.append(results)
+
+    @classmethod
+    def _flush_benchmark_results(cls) -> None:
+        """Append all queued results to the results file in a single write"""
+        if not cls._pending_results:
+            return
+        buf = ''.join(json.dumps(r) + '\n' for r in cls._pending_results).encode()
         try:
-            with open('benchmark_results.json', 'a') as f:
-                json.dump(results, f)
-                f.write('\n')
-        except IOError as e:
+            # O_APPEND with one write keeps records from concurrent runs whole
+            fd = os.open('benchmark_results.json',
+                         os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, buf)
+            finally:
+                os.close(fd)
+        except OSError as e:
             logger.error(f"Failed to save benchmark results: {e}")
+        cls._pending_results.clear()
 
     def _log_benchmark_results(self, total_time: float) -> None:
         """Log final benchmark summary"""
@@ -151,7 +233,7 @@ class PlayerControlsBenchmark(unittest.TestCase):
 
     def _verify_performance_requirements(self, metrics: List[float]) -> None:
         """Verify if performance meets requirements"""
-        mean_time = statistics.mean(metrics)
+        mean_time = float(np.mean(metrics))
         
         # Performance thresholds
         MAX_INPUT_LATENCY = 16.0  # ms (60fps frame budget)
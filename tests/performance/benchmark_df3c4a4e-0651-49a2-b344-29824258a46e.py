@@ -7,13 +7,18 @@ File: tests/performance/benchmark_df3c4a4e-0651-49a2-b344-29824258a46e.py
 
 import time
 # TODO: Fix import - import unittest
-# TODO: Fix import - import statistics
-from typing import List, Dict, Tuple
+from typing import Dict, Optional
 # TODO: Fix import - from dataclasses import dataclass
 import json
 import logging
 from datetime import datetime
 
+import numpy as np
+
+from perf_utils import (
+    calibrate_iterations, gc_paused, pin_cpu, restore_cpu_affinity
+)
+
 from app.config.logging import configure_logging
 from app.models.project import ProjectPhase, DEVELOPMENT
 from app.code_analysis.treesitter.enhanced_models import AnalysisMode
@@ -23,11 +28,21 @@ from app.api.models.intelligence_models import ProjectMetricsResponse
 logger = logging.getLogger(__name__)
 configure_logging()
 
-@dataclass
+def _entity_kernel(n: int) -> float:
+    """Synthetic per-entity workload: a few multiply-adds per entity, the
+    shape of a position/velocity update, so timings reflect arithmetic
+    rather than bare loop dispatch"""
+    acc = 0.0
+    x = 0.0
+    for i in range(n):
+        x = x * 0.98 + i * 1.0001
+        acc += x * 0.5 + 1.0
+    return acc
+
+@dataclass(slots=True, frozen=True)
 class BenchmarkMetrics:
-    """Container for benchmark measurement results"""
+    """Container for benchmark summary statistics"""
     operation_name: str
-    execution_times: List[float]
     mean_time: float
     median_time: float
     std_dev: float
@@ -48,50 +63,83 @@ class BenchmarkMetrics:
 class GameSystemsBenchmark:
     """Benchmark handler for game systems integration testing"""
     
-    def __init__(self, iterations: int = 1000):
+    def __init__(self, iterations: Optional[int] = None, budget: float = 0.5):
+        # A fixed iteration count overrides calibration against the budget
         self.iterations = iterations
+        self.budget = budget
         self.results: Dict[str, BenchmarkMetrics] = {}
+        # Raw per-call samples, kept apart from the summary metrics
+        self.raw_times: Dict[str, np.ndarray] = {}
         
-    def measure_operation(self, operation_name: str, operation_func) -> BenchmarkMetrics:
+    def measure_operation(self, operation_name: str, operation_func,
+                          inner: int = 64) -> BenchmarkMetrics:
         """
         Measure performance metrics for a given operation
         
         Args:
             operation_name: Name of the operation being measured
             operation_func: Function to benchmark
+            inner: Calls per timed block; each sample is the block's
+                per-call average, keeping clock overhead out of fast paths
             
         Returns:
             BenchmarkMetrics object containing performance data
         """
-        execution_times = []
+        iterations = self.iterations
+        if iterations is None:
+            iterations = calibrate_iterations(operation_func, self.budget)
+        # At least two blocks so the standard deviation is defined
+        blocks = max(2, iterations // inner)
+        block_ns = np.empty(blocks, dtype=np.int64)
+        # Bind to a local so the timed region doesn't pay for attribute lookups
+        perf_counter_ns = time.perf_counter_ns
         
-        for _ in range(self.iterations):
-            start_time = time.perf_counter()
+        # Untimed warmup calls absorb cold-start cost
+        for _ in range(max(10, iterations // 100)):
             operation_func()
-            end_time = time.perf_counter()
-            execution_times.append(end_time - start_time)
+        
+        with gc_paused():
+            for i in range(blocks):
+                start_time = perf_counter_ns()
+                for _ in range(inner):
+                    operation_func()
+                end_time = perf_counter_ns()
+                block_ns[i] = end_time - start_time
+        times = block_ns / (inner * 1e9)  # per-call seconds
             
         metrics = BenchmarkMetrics(
             operation_name=operation_name,
-            execution_times=execution_times,
-            mean_time=statistics.mean(execution_times),
-            median_time=statistics.median(execution_times),
-            std_dev=statistics.stdev(execution_times),
-            min_time=min(execution_times),
-            max_time=max(execution_times)
+            mean_time=float(times.mean()),
+            median_time=float(np.median(times)),
+            std_dev=float(times.std(ddof=1)),
+            min_time=float(times.min()),
+            max_time=float(times.max())
         )
         
         self.results[operation_name] = metrics
+        self.raw_times[operation_name] = times
         return metrics
 
 class TestGameSystemsIntegration(unittest.TestCase):
     """Performance benchmark tests for game systems integration"""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up configuration shared by all tests"""
+        # Seconds of measured work per operation; iteration counts are
+        # calibrated from it
+        cls.time_budget = 0.5
+        # Registered right away so the pin is released even if the rest of
+        # setUpClass raises and tearDownClass never runs
+        cls.addClassCleanup(restore_cpu_affinity, pin_cpu())
+        # Results files from this run all carry the same timestamp
+        cls._suite_ts = datetime.now().isoformat()
+        logger.info("Starting game systems integration benchmark tests")
+
     def setUp(self):
-        """Set up test environment"""
-        self.benchmark = GameSystemsBenchmark(iterations=1000)
+        """Set up per-test benchmark state"""
+        self.benchmark = GameSystemsBenchmark(budget=self.time_budget)
         self.start_time = time.time()
-        logger.info("Starting game systems integration benchmark tests")
 
     def tearDown(self):
         """Clean up and log results"""
@@ -101,26 +149,27 @@ class TestGameSystemsIntegration(unittest.TestCase):
     def _log_benchmark_results(self, total_time: float):
         """Log benchmark results and save to file"""
         results = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._suite_ts,
             "total_execution_time": round(total_time, 2),
             "metrics": [m.to_dict() for m in self.benchmark.results.values()]
         }
         
-        # Log results
-        logger.info("Benchmark Results:")
-        logger.info(json.dumps(results, indent=2))
+        # Log a summary only; the full metrics go to the results file
+        logger.info(
+            "Benchmark Results: %d operation(s) in %.2fs",
+            len(results["metrics"]), results["total_execution_time"]
+        )
         
         # Save results to file
         filename = f"benchmark_results_{int(time.time())}.json"
         with open(filename, 'w') as f:
-            json.dump(results, f, indent=2)
+            json.dump(results, f)
 
     def test_input_processing_performance(self):
         """Benchmark input processing system integration"""
         def simulate_input_processing():
             # Simulate input processing operations
-            for _ in range(100):
-                pass  # Placeholder for actual input processing simulation
+            _entity_kernel(100)
         
         metrics = self.benchmark.measure_operation(
             "input_processing",
@@ -132,8 +181,7 @@ class TestGameSystemsIntegration(unittest.TestCase):
         """Benchmark collision detection system integration"""
         def simulate_collision_detection():
             # Simulate collision detection for multiple entities
-            for _ in range(50):
-                pass  # Placeholder for collision detection simulation
+            _entity_kernel(50)
         
         metrics = self.benchmark.measure_operation(
             "collision_detection",
@@ -145,12 +193,12 @@ class TestGameSystemsIntegration(unittest.TestCase):
         """Benchmark audio system integration"""
         def simulate_audio_processing():
             # Simulate audio system operations
-            for _ in range(10):
-                pass  # Placeholder for audio system simulation
+            _entity_kernel(10)
         
         metrics = self.benchmark.measure_operation(
             "audio_system",
-            simulate_audio_processing
+            simulate_audio_processing,
+            inner=1024
         )
         self.assertLess(metrics.mean_time, 0.0005)  # Should complete in under 0.5ms
 
@@ -158,8 +206,7 @@ class TestGameSystemsIntegration(unittest.TestCase):
         """Benchmark rendering system integration"""
         def simulate_rendering():
             # Simulate rendering operations
-            for _ in range(100):
-                pass  # Placeholder for rendering simulation
+            _entity_kernel(100)
         
         metrics = self.benchmark.measure_operation(
             "rendering",
@@ -171,8 +218,7 @@ class TestGameSystemsIntegration(unittest.TestCase):
         """Benchmark game state management system integration"""
         def simulate_state_management():
             # Simulate state management operations
-            for _ in range(20):
-                pass  # Placeholder for state management simulation
+            _entity_kernel(20)
         
         metrics = self.benchmark.measure_operation(
             "state_management",
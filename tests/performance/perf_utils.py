@@ -0,0 +1,97 @@
+"""
+Shared helpers for the Python performance benchmarks.
+
+Covers CPU pinning, sizing measured runs to a wall-clock budget and
+keeping the garbage collector out of timed regions.
+
+File: tests/performance/perf_utils.py
+"""
+
+import gc
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+MIN_ITERATIONS = 100
+MAX_ITERATIONS = 10_000_000
+
+
+def pin_cpu() -> Optional[Set[int]]:
+    """
+    Pin the benchmark process to a single CPU to cut migration jitter.
+
+    Linux only; elsewhere, or if the call is refused, the run continues
+    unpinned. CI runners can get the same effect by launching the suite under
+    `taskset -c 0`.
+
+    Returns:
+        The original affinity mask, to hand back to restore_cpu_affinity,
+        or None if the process was left unpinned
+    """
+    if sys.platform != 'linux':
+        logger.info("CPU pinning skipped: unsupported platform %s", sys.platform)
+        return None
+    try:
+        original = os.sched_getaffinity(0)
+        cpu = min(original)
+        os.sched_setaffinity(0, {cpu})
+    except (AttributeError, OSError) as e:
+        logger.info("CPU pinning skipped: %s", e)
+        return None
+    logger.info("Benchmark process pinned to CPU %d", cpu)
+    return original
+
+
+def restore_cpu_affinity(mask: Optional[Set[int]]) -> None:
+    """Undo pin_cpu, so later tests in the same process run unpinned."""
+    if mask is None:
+        return
+    try:
+        os.sched_setaffinity(0, mask)
+    except OSError as e:
+        logger.warning("Failed to restore CPU affinity: %s", e)
+
+
+def calibrate_iterations(op: Callable[[], object], budget: float,
+                         probe: int = 10) -> int:
+    """
+    Pick an iteration count so the measured run takes about budget seconds.
+
+    Args:
+        op: Operation to be benchmarked
+        budget: Target wall-clock time in seconds for the measured run
+        probe: Calls used to estimate the per-call cost
+
+    Returns:
+        Iteration count clamped to [MIN_ITERATIONS, MAX_ITERATIONS]
+    """
+    start_time = time.perf_counter()
+    for _ in range(probe):
+        op()
+    per_call = (time.perf_counter() - start_time) / probe
+    if per_call <= 0:
+        return MAX_ITERATIONS
+    return int(min(max(budget / per_call, MIN_ITERATIONS), MAX_ITERATIONS))
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """
+    Collect pending garbage, then keep the GC disabled inside the block.
+
+    The collector's previous state is restored on exit, so nesting or a
+    caller that already disabled GC is left as it was.
+    """
+    gc.collect()
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()